@@ -6,31 +6,36 @@ peer review, refinement, judging, and grading.
 """
 
 import argparse
-import json
+import asyncio
 import logging
 import random
-from datetime import datetime
 from pathlib import Path
+from statistics import mean
 
+import orjson
 from dotenv import load_dotenv
-from openai import OpenAI
+from openai import AsyncOpenAI
 
-from src.agents import PERSONAS
+from src.agents import PERSONAS, create_async_client
 from src.models import (
+    ErrorRecord,
     EvaluationResult,
     JudgeVerdict,
     PeerReview,
     RefinedSolution,
+    ResultRecord,
     RolePreference,
     Solution,
 )
 from src.orchestrator import (
-    generate_critique,
-    generate_solution,
-    get_role_preference,
-    grade_answer,
-    judge_verdict,
-    refine_solution,
+    abatch_role_preferences,
+    abatch_solutions,
+    agenerate_critique,
+    agenerate_solution,
+    aget_role_preferences,
+    agrade_answer,
+    ajudge_verdict,
+    arefine_solution,
 )
 
 # Load environment variables from .env file
@@ -46,7 +51,11 @@ logger = logging.getLogger(__name__)
 # Paths
 DATA_DIR = Path("data")
 PROBLEMS_PATH = DATA_DIR / "problems.json"
-RESULTS_PATH = DATA_DIR / "results_log.json"
+RESULTS_PATH = DATA_DIR / "results_log.jsonl"
+
+# Number of debates kept in flight at once; overlapping problems keeps the
+# API pipe busy while individual debates wait on sequential stages.
+DEFAULT_PARALLEL_PROBLEMS = 8
 
 
 def load_problems(path: Path) -> list[dict]:
@@ -59,21 +68,23 @@ def load_problems(path: Path) -> list[dict]:
     Returns:
         List of problem dictionaries.
     """
-    with open(path, "r") as f:
-        return json.load(f)
+    return orjson.loads(path.read_bytes())
 
 
-def save_results(results: list[dict], path: Path) -> None:
+def save_results(record: ResultRecord | ErrorRecord, path: Path) -> None:
     """
-    Save results to JSON file.
+    Append a single result to the JSONL results file.
+
+    Only the new record is serialized, so saving after every problem costs
+    O(1) per problem instead of rewriting the whole file each time.
 
     Args:
-        results: List of result dictionaries.
-        path: Path to save the results.
+        record: Result (or error) record for one problem.
+        path: Path of the JSONL results file.
     """
-    with open(path, "w") as f:
-        json.dump(results, f, indent=2, default=str)
-    logger.info(f"Results saved to {path}")
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(record.model_dump_json(exclude_none=True) + "\n")
+    logger.info("Result for problem %s saved to %s", record.problem_id, path)
 
 
 def assign_roles(
@@ -104,130 +115,324 @@ def assign_roles(
     # Remaining agents become solvers
     solver_ids = [p.agent_id for p in preferences if p.agent_id != judge_id]
 
-    logger.info(f"Role Assignment: Judge={judge_id}, Solvers={solver_ids}")
+    logger.info("Role Assignment: Judge=%s, Solvers=%s", judge_id, solver_ids)
     return judge_id, solver_ids
 
 
-def run_debate(
-    client: OpenAI,
+async def arun_debate(
+    client: AsyncOpenAI,
     problem: dict,
-) -> dict:
+    preferences: list[RolePreference] | None = None,
+    initial_solutions: dict[str, Solution] | None = None,
+) -> ResultRecord:
     """
     Run the full debate workflow for a single problem.
 
+    Independent calls within each stage are issued concurrently; stages
+    themselves stay sequential because each depends on the previous one.
+
     Args:
-        client: OpenAI client instance.
+        client: AsyncOpenAI client instance.
         problem: Problem dictionary with 'question' and 'ground_truth'.
+        preferences: Stage 0 results computed ahead of time (e.g. via the
+            Batch API). Fetched in real time if omitted.
+        initial_solutions: Stage 1 results computed ahead of time, keyed by
+            solver ID; their keys define the solvers, and the remaining agent
+            is the judge. Generated in real time if omitted.
 
     Returns:
-        Result dictionary with all debate data and evaluation.
+        ResultRecord with all debate data and evaluation.
     """
     question = problem["question"]
     ground_truth = problem["ground_truth"]
     problem_id = problem["id"]
 
-    logger.info(f"=== Processing Problem {problem_id} ===")
-    logger.info(f"Category: {problem.get('category', 'Unknown')}")
+    logger.info("=== Processing Problem %s ===", problem_id)
+    logger.info("Category: %s", problem.get("category", "Unknown"))
 
-    # Stage 0: Role Assignment
-    logger.info("Stage 0: Getting role preferences...")
     agent_ids = list(PERSONAS.keys())
-    preferences: list[RolePreference] = []
 
-    for agent_id in agent_ids:
-        pref = get_role_preference(client, agent_id, question)
-        preferences.append(pref)
-        logger.info(
-            f"  Agent {agent_id}: {pref.role_priority} (confidence: {pref.confidence:.2f})"
-        )
-
-    judge_id, solver_ids = assign_roles(preferences)
+    # Stage 0: Role Assignment
+    if preferences is None:
+        logger.info("Stage 0: Getting role preferences...")
+        preferences = await aget_role_preferences(client, question)
+    else:
+        logger.info("Stage 0: Using precomputed role preferences...")
+
+    if logger.isEnabledFor(logging.INFO):
+        for agent_id, pref in zip(agent_ids, preferences):
+            logger.info(
+                "  Agent %s: %s (confidence: %.2f)",
+                agent_id,
+                pref.role_priority,
+                pref.confidence,
+            )
 
     # Stage 1: Independent Solutions
-    logger.info("Stage 1: Generating independent solutions...")
-    initial_solutions: dict[str, Solution] = {}
+    if initial_solutions is None:
+        judge_id, solver_ids = assign_roles(preferences)
+
+        logger.info("Stage 1: Generating independent solutions...")
+        solutions: list[Solution] = await asyncio.gather(
+            *(agenerate_solution(client, sid, question) for sid in solver_ids)
+        )
+        initial_solutions = dict(zip(solver_ids, solutions))
+    else:
+        # Roles were already assigned when the solutions were precomputed
+        solver_ids = list(initial_solutions.keys())
+        judge_id = next(a for a in agent_ids if a not in initial_solutions)
+
+        logger.info("Stage 1: Using precomputed solutions...")
 
-    for solver_id in solver_ids:
-        solution = generate_solution(client, solver_id, question)
-        initial_solutions[solver_id] = solution
-        logger.info(f"  Solver {solver_id} answer: {solution.final_answer[:50]}...")
+    if logger.isEnabledFor(logging.INFO):
+        for solver_id, solution in initial_solutions.items():
+            logger.info(
+                "  Solver %s answer: %.50s...", solver_id, solution.final_answer
+            )
 
     # Stage 2: Peer Review (Round Robin)
     logger.info("Stage 2: Conducting peer reviews...")
     all_reviews: dict[str, list[PeerReview]] = {sid: [] for sid in solver_ids}
+    review_pairs = [
+        (reviewer_id, target_id)
+        for reviewer_id in solver_ids
+        for target_id in solver_ids
+        if reviewer_id != target_id
+    ]
+    reviews: list[PeerReview] = await asyncio.gather(
+        *(
+            agenerate_critique(
+                client,
+                reviewer_id,
+                target_id,
+                question,
+                initial_solutions[target_id],
+            )
+            for reviewer_id, target_id in review_pairs
+        )
+    )
 
-    for reviewer_id in solver_ids:
-        for target_id in solver_ids:
-            if reviewer_id != target_id:
-                review = generate_critique(
-                    client,
-                    reviewer_id,
-                    target_id,
-                    question,
-                    initial_solutions[target_id],
-                )
-                all_reviews[target_id].append(review)
-                logger.info(
-                    f"  {reviewer_id} reviewed {target_id}: Score {review.score}/10"
-                )
+    for (reviewer_id, target_id), review in zip(review_pairs, reviews):
+        all_reviews[target_id].append(review)
+        logger.info(
+            "  %s reviewed %s: Score %d/10", reviewer_id, target_id, review.score
+        )
 
     # Stage 3: Refinement
     logger.info("Stage 3: Refining solutions...")
-    refined_solutions: dict[str, RefinedSolution] = {}
+    refined_list: list[RefinedSolution] = await asyncio.gather(
+        *(
+            arefine_solution(
+                client,
+                solver_id,
+                question,
+                initial_solutions[solver_id],
+                all_reviews[solver_id],
+            )
+            for solver_id in solver_ids
+        )
+    )
+    refined_solutions: dict[str, RefinedSolution] = dict(zip(solver_ids, refined_list))
+
+    if logger.isEnabledFor(logging.INFO):
+        for solver_id, refined in refined_solutions.items():
+            logger.info(
+                "  Solver %s refined answer: %.50s...", solver_id, refined.final_answer
+            )
+
+    # Stage 4: Judge Verdict
+    logger.info("Stage 4: Getting judge verdict...")
+    grading_tasks: dict[str, asyncio.Task[EvaluationResult]] = {}
+
+    def start_grading(answer: str) -> None:
+        # Grading depends only on the answer text, so one task per answer
+        if answer not in grading_tasks:
+            grading_tasks[answer] = asyncio.create_task(
+                agrade_answer(client, question, ground_truth, answer)
+            )
 
-    for solver_id in solver_ids:
-        refined = refine_solution(
+    def on_verdict_field(field: str, value: object) -> None:
+        # Grade the final answer as soon as it is decoded, overlapping the
+        # grading call with the rest of the judge's response
+        if field == "final_answer_to_user":
+            start_grading(value)
+
+    try:
+        # Speculatively grade the best-reviewed refined answer while the judge
+        # deliberates; judges usually pick it, making grading free when so
+        best_guess_id = max(
+            solver_ids,
+            key=lambda sid: mean(r.score for r in all_reviews[sid]),
+        )
+        start_grading(refined_solutions[best_guess_id].final_answer)
+
+        verdict: JudgeVerdict = await ajudge_verdict(
             client,
-            solver_id,
+            judge_id,
             question,
-            initial_solutions[solver_id],
-            all_reviews[solver_id],
-        )
-        refined_solutions[solver_id] = refined
-        logger.info(
-            f"  Solver {solver_id} refined answer: {refined.final_answer[:50]}..."
+            solver_ids,
+            initial_solutions,
+            all_reviews,
+            refined_solutions,
+            on_field_complete=on_verdict_field,
         )
+        logger.info("  Winner: Solver %s", verdict.best_solver_id)
+        logger.info("  Final Answer: %s", verdict.final_answer_to_user)
+
+        # Grading
+        logger.info("Grading final answer...")
+        start_grading(verdict.final_answer_to_user)
+        grading = grading_tasks.pop(verdict.final_answer_to_user)
+        evaluation: EvaluationResult = await grading
+    finally:
+        # Drop grading started for answers the judge did not settle on (a
+        # missed speculative guess or a failed, retried judge call)
+        for task in grading_tasks.values():
+            task.cancel()
+        # Wait for them so a task that already failed has its exception
+        # retrieved instead of being reported at shutdown
+        await asyncio.gather(*grading_tasks.values(), return_exceptions=True)
+
+    logger.info("  Correct: %s", evaluation.is_correct)
 
-    # Stage 4: Judge Verdict
-    logger.info("Stage 4: Getting judge verdict...")
-    verdict: JudgeVerdict = judge_verdict(
-        client,
-        judge_id,
-        question,
-        solver_ids,
-        initial_solutions,
-        all_reviews,
-        refined_solutions,
+    # Compile result
+    return ResultRecord(
+        problem_id=problem_id,
+        category=problem.get("category"),
+        difficulty=problem.get("difficulty"),
+        question=question,
+        ground_truth=ground_truth,
+        role_preferences=preferences,
+        judge_id=judge_id,
+        solver_ids=solver_ids,
+        initial_solutions=initial_solutions,
+        reviews=all_reviews,
+        refined_solutions=refined_solutions,
+        verdict=verdict,
+        evaluation=evaluation,
     )
-    logger.info(f"  Winner: Solver {verdict.best_solver_id}")
-    logger.info(f"  Final Answer: {verdict.final_answer_to_user}")
 
-    # Grading
-    logger.info("Grading final answer...")
-    evaluation: EvaluationResult = grade_answer(
-        client, question, ground_truth, verdict.final_answer_to_user
-    )
-    logger.info(f"  Correct: {evaluation.is_correct}")
 
-    # Compile result
-    result = {
-        "problem_id": problem_id,
-        "category": problem.get("category"),
-        "difficulty": problem.get("difficulty"),
-        "question": question,
-        "ground_truth": ground_truth,
-        "role_preferences": [p.model_dump() for p in preferences],
-        "judge_id": judge_id,
-        "solver_ids": solver_ids,
-        "initial_solutions": {k: v.model_dump() for k, v in initial_solutions.items()},
-        "reviews": {k: [r.model_dump() for r in v] for k, v in all_reviews.items()},
-        "refined_solutions": {k: v.model_dump() for k, v in refined_solutions.items()},
-        "verdict": verdict.model_dump(),
-        "evaluation": evaluation.model_dump(),
-        "timestamp": datetime.now().isoformat(),
-    }
-
-    return result
+async def run_problems(
+    client: AsyncOpenAI,
+    problems: list[dict],
+    max_parallel_problems: int,
+    use_batch: bool = False,
+) -> list[ResultRecord | ErrorRecord]:
+    """
+    Run debates for all problems concurrently on one shared client.
+
+    Up to max_parallel_problems debates are in flight at once, so different
+    problems sit in different stages (e.g. one problem's judge verdict
+    overlaps the next problem's solutions) and the API semaphore stays
+    saturated. Bounding the number of open problems lets early problems
+    finish and be saved instead of all problems advancing in lockstep.
+
+    With use_batch, Stages 0 and 1 for every problem are run up front
+    through the Batch API; only the dependent Stages 2-4 and grading run in
+    real time.
+
+    Args:
+        client: AsyncOpenAI client instance.
+        problems: List of problem dictionaries.
+        max_parallel_problems: Maximum number of debates running at once.
+        use_batch: Whether to run Stages 0 and 1 through the Batch API.
+
+    Returns:
+        List of result records (including error records).
+    """
+    preferences_by_problem: dict[int, list[RolePreference]] = {}
+    solutions_by_problem: dict[int, dict[str, Solution]] = {}
+
+    if use_batch:
+        logger.info("Batch mode: submitting Stage 0 for all problems...")
+        preferences_by_problem = await abatch_role_preferences(client, problems)
+
+        solver_ids_by_problem = {
+            problem_id: assign_roles(preferences)[1]
+            for problem_id, preferences in preferences_by_problem.items()
+        }
+
+        logger.info("Batch mode: submitting Stage 1 for all problems...")
+        solutions_by_problem = await abatch_solutions(
+            client, problems, solver_ids_by_problem
+        )
+
+    results: list[ResultRecord | ErrorRecord] = []
+    problem_slots = asyncio.Semaphore(max_parallel_problems)
+    results_lock = asyncio.Lock()
+
+    async def record(entry: ResultRecord | ErrorRecord) -> None:
+        # Serialize appends so concurrent debates never interleave writes;
+        # the write runs in a thread to keep the event loop free.
+        async with results_lock:
+            results.append(entry)
+            await asyncio.to_thread(save_results, entry, RESULTS_PATH)
+
+    async def run_problem(problem: dict) -> None:
+        async with problem_slots:
+            try:
+                result = await arun_debate(
+                    client,
+                    problem,
+                    preferences=preferences_by_problem.get(problem["id"]),
+                    initial_solutions=solutions_by_problem.get(problem["id"]),
+                )
+            except Exception as e:
+                logger.error("Error processing problem %s: %s", problem["id"], e)
+                result = ErrorRecord(problem_id=problem["id"], error=str(e))
+
+        # Save after each problem (incremental saving)
+        await record(result)
+
+    await asyncio.gather(*(run_problem(p) for p in problems))
+
+    return results
+
+
+async def amain(
+    problems: list[dict],
+    max_parallel_problems: int,
+    use_batch: bool = False,
+) -> list[ResultRecord | ErrorRecord]:
+    """
+    Create the shared client and run all debates on it.
+
+    The client is created inside the running event loop so its connection
+    pool is bound to that loop, and closed before the loop shuts down.
+
+    Args:
+        problems: List of problem dictionaries.
+        max_parallel_problems: Maximum number of debates running at once.
+        use_batch: Whether to run Stages 0 and 1 through the Batch API.
+
+    Returns:
+        List of result records (including error records).
+    """
+    async with create_async_client() as client:
+        return await run_problems(client, problems, max_parallel_problems, use_batch)
+
+
+def positive_int(value: str) -> int:
+    """
+    Parse a command-line integer that must be at least 1.
+
+    Args:
+        value: Raw argument value.
+
+    Returns:
+        The parsed integer.
+
+    Raises:
+        argparse.ArgumentTypeError: If the value is not an integer >= 1.
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'") from None
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
 
 
 def main() -> None:
@@ -240,55 +445,48 @@ def main() -> None:
         type=int,
         help="Run only on a specific problem ID",
     )
+    parser.add_argument(
+        "--max-parallel-problems",
+        type=positive_int,
+        default=DEFAULT_PARALLEL_PROBLEMS,
+        help="Maximum number of problems debated concurrently",
+    )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Run role preferences and initial solutions through the Batch API "
+        "(cheaper, but can take up to 24h)",
+    )
     args = parser.parse_args()
 
-    # Initialize OpenAI client
-    client = OpenAI()
-
     # Load problems
     problems = load_problems(PROBLEMS_PATH)
-    logger.info(f"Loaded {len(problems)} problems")
+    logger.info("Loaded %d problems", len(problems))
 
     # Filter to specific problem if requested
     if args.test_id is not None:
         problems = [p for p in problems if p["id"] == args.test_id]
         if not problems:
-            logger.error(f"Problem with ID {args.test_id} not found")
+            logger.error("Problem with ID %s not found", args.test_id)
             return
-        logger.info(f"Running on problem ID {args.test_id} only")
+        logger.info("Running on problem ID %s only", args.test_id)
+
+    # Start a fresh results file for this run
+    RESULTS_PATH.write_text("")
 
     # Run debates
-    results: list[dict] = []
-
-    for problem in problems:
-        try:
-            result = run_debate(client, problem)
-            results.append(result)
-
-            # Save after each problem (incremental saving)
-            save_results(results, RESULTS_PATH)
-
-        except Exception as e:
-            logger.error(f"Error processing problem {problem['id']}: {e}")
-            results.append(
-                {
-                    "problem_id": problem["id"],
-                    "error": str(e),
-                    "timestamp": datetime.now().isoformat(),
-                }
-            )
+    results = asyncio.run(amain(problems, args.max_parallel_problems, args.batch))
 
     # Final summary
-    correct_count = sum(
-        1 for r in results if r.get("evaluation", {}).get("is_correct", False)
-    )
-    total_count = len([r for r in results if "evaluation" in r])
+    evaluated = [r for r in results if isinstance(r, ResultRecord)]
+    correct_count = sum(1 for r in evaluated if r.evaluation.is_correct)
+    total_count = len(evaluated)
 
     logger.info("=== Final Summary ===")
-    logger.info(f"Total problems processed: {len(results)}")
-    logger.info(f"Correct answers: {correct_count}/{total_count}")
+    logger.info("Total problems processed: %d", len(results))
+    logger.info("Correct answers: %d/%d", correct_count, total_count)
     if total_count > 0:
-        logger.info(f"Accuracy: {correct_count / total_count * 100:.1f}%")
+        logger.info("Accuracy: %.1f%%", correct_count / total_count * 100)
 
 
 if __name__ == "__main__":
@@ -4,16 +4,33 @@ Agent module for the Multi-LLM Collaborative Debate System.
 Contains persona definitions and the GPT API wrapper with retry logic.
 """
 
+import asyncio
+import hashlib
 import logging
-from typing import TypeVar
+import os
+import threading
+from pathlib import Path
+from typing import Any, Callable, TypeVar
 
-from openai import OpenAI
+import aiohttp
+import diskcache
+import httpx
+import jiter
+from httpx_aiohttp import AiohttpTransport
+from openai import (
+    APIConnectionError,
+    AsyncOpenAI,
+    DefaultAioHttpClient,
+    InternalServerError,
+    OpenAI,
+    RateLimitError,
+)
 from pydantic import BaseModel
 from tenacity import (
     retry,
     retry_if_exception_type,
     stop_after_attempt,
-    wait_exponential,
+    wait_random_exponential,
 )
 
 logger = logging.getLogger(__name__)
@@ -21,6 +38,25 @@ logger = logging.getLogger(__name__)
 # Model configuration
 MODEL_NAME = "gpt-4o-mini"
 
+# Cap on open connections in the async client's aiohttp connector pool.
+# Concurrent stages fan out many requests at once; finished connections go
+# back to the pool and are reused until aiohttp's keep-alive timeout expires.
+MAX_CONNECTIONS = 64
+
+# Seconds to cache DNS lookups for the API host across requests
+DNS_CACHE_TTL = 300
+
+# Default cap on in-flight API calls across all concurrent stages and problems.
+# Override with the OPENAI_CONCURRENCY environment variable to match your
+# account's rate limits.
+DEFAULT_CONCURRENCY = 32
+
+# Strict response_format params, built once per response model class
+_RESPONSE_FORMAT_CACHE: dict[type[BaseModel], dict] = {}
+
+# On-disk cache for responses that are pure functions of their prompt
+CACHE_DIR = Path("data") / "llm_cache"
+
 # Agent Personas - distinct system prompts to prevent mode collapse
 PERSONAS: dict[str, str] = {
     "A": (
@@ -46,21 +82,244 @@ PERSONAS: dict[str, str] = {
 
 T = TypeVar("T", bound=BaseModel)
 
+# Callback invoked with (field_name, value) once a response field is final
+FieldCallback = Callable[[str, Any], None]
 
-@retry(
-    stop=stop_after_attempt(3),
-    wait=wait_exponential(multiplier=1, min=2, max=10),
-    retry=retry_if_exception_type(Exception),
+# Only transient failures are retried; bad requests, auth errors and parse
+# failures fail fast instead of burning quota. Jittered backoff keeps many
+# concurrent calls from retrying in lockstep against the rate limiter.
+# (APITimeoutError is a subclass of APIConnectionError.) A connection dropped
+# while a streamed response is being read surfaces as a raw httpx
+# NetworkError or RemoteProtocolError, which the SDK does not wrap.
+_retry_transient_errors = retry(
+    stop=stop_after_attempt(5),
+    wait=wait_random_exponential(multiplier=1, max=30),
+    retry=retry_if_exception_type(
+        (
+            APIConnectionError,
+            RateLimitError,
+            InternalServerError,
+            httpx.NetworkError,
+            httpx.RemoteProtocolError,
+        )
+    ),
     before_sleep=lambda retry_state: logger.warning(
-        f"API call failed, retrying (attempt {retry_state.attempt_number})..."
+        "API call failed, retrying (attempt %d)...", retry_state.attempt_number
     ),
 )
+
+_api_semaphore: asyncio.Semaphore | None = None
+_response_cache: diskcache.Cache | None = None
+_response_cache_lock = threading.Lock()
+
+
+def _get_api_semaphore() -> asyncio.Semaphore:
+    """
+    Return the process-wide semaphore bounding concurrent API calls.
+
+    Created lazily so OPENAI_CONCURRENCY is read after .env has been loaded.
+
+    Raises:
+        ValueError: If OPENAI_CONCURRENCY is not an integer of at least 1.
+    """
+    global _api_semaphore
+    if _api_semaphore is None:
+        concurrency = int(os.getenv("OPENAI_CONCURRENCY", str(DEFAULT_CONCURRENCY)))
+        if concurrency < 1:
+            raise ValueError(
+                f"OPENAI_CONCURRENCY must be at least 1, got {concurrency}"
+            )
+        _api_semaphore = asyncio.Semaphore(concurrency)
+    return _api_semaphore
+
+
+def create_async_client() -> AsyncOpenAI:
+    """
+    Create an AsyncOpenAI client that sends requests over aiohttp.
+
+    httpx's own async transport scales poorly with many concurrent requests,
+    so the SDK's aiohttp transport is used instead, backed by one shared
+    ClientSession for the whole run. The SDK still handles structured output
+    parsing, streaming and typed errors on top of it.
+
+    Returns:
+        AsyncOpenAI client using an aiohttp connection pool of MAX_CONNECTIONS.
+    """
+    transport = AiohttpTransport(
+        # Called lazily on the first request, inside the running event loop
+        client=lambda: aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=MAX_CONNECTIONS,
+                ttl_dns_cache=DNS_CACHE_TTL,
+            )
+        ),
+    )
+    return AsyncOpenAI(http_client=DefaultAioHttpClient(transport=transport))
+
+
+def _resolve_system_prompt(agent_id: str, system_prompt_override: str | None) -> str:
+    """
+    Select the system prompt for a call.
+
+    Args:
+        agent_id: Agent identifier (A, B, C, or D) to select persona.
+        system_prompt_override: Optional override for the system prompt.
+
+    Returns:
+        The override if provided, otherwise the agent's persona.
+
+    Raises:
+        ValueError: If agent_id is not found in PERSONAS and no override is given.
+    """
+    if agent_id not in PERSONAS and system_prompt_override is None:
+        raise ValueError(
+            f"Unknown agent_id: {agent_id}. Must be one of {list(PERSONAS.keys())}"
+        )
+
+    return system_prompt_override if system_prompt_override else PERSONAS[agent_id]
+
+
+def _get_response_cache() -> diskcache.Cache:
+    """Return the on-disk response cache, opening it on first use."""
+    global _response_cache
+    # Async calls reach the cache from worker threads, so guard the first open
+    with _response_cache_lock:
+        if _response_cache is None:
+            _response_cache = diskcache.Cache(str(CACHE_DIR))
+    return _response_cache
+
+
+def _cache_key(messages: list[dict[str, str]], response_model: type[BaseModel]) -> str:
+    """Build the cache key for a call from its model, prompts and schema."""
+    raw = MODEL_NAME + "".join(m["content"] for m in messages) + response_model.__name__
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _cache_get(key: str, response_model: type[T]) -> T | None:
+    """Look up a cached response, returning None on a miss."""
+    cached = _get_response_cache().get(key)
+    if cached is None:
+        return None
+    logger.debug("Cache hit for %s (%.12s)", response_model.__name__, key)
+    return response_model.model_validate_json(cached)
+
+
+def _cache_set(key: str, parsed: BaseModel) -> None:
+    """Store a parsed response in the cache."""
+    _get_response_cache().set(key, parsed.model_dump_json())
+
+
+def _notify_completed_fields(
+    partial: dict[str, Any],
+    reported: set[str],
+    on_field_complete: FieldCallback,
+    final: bool = False,
+) -> None:
+    """
+    Report response fields whose values can no longer change.
+
+    jiter's partial mode only includes a string once its closing quote has
+    arrived, so a trailing string field is already final; any
+    other trailing value (number, list, object) may still be growing until
+    the next key appears.
+
+    Args:
+        partial: Partially parsed response object so far.
+        reported: Names of fields already reported; updated in place.
+        on_field_complete: Callback receiving (field_name, value).
+        final: Whether the response is complete, making every field final.
+    """
+    names = list(partial.keys())
+    for i, name in enumerate(names):
+        if name in reported:
+            continue
+        is_trailing = i == len(names) - 1
+        if is_trailing and not final and not isinstance(partial[name], str):
+            continue
+        reported.add(name)
+        on_field_complete(name, partial[name])
+
+
+def build_messages(
+    agent_id: str,
+    user_prompt: str,
+    system_prompt_override: str | None = None,
+) -> list[dict[str, str]]:
+    """
+    Build the chat messages for a call.
+
+    Args:
+        agent_id: Agent identifier (A, B, C, or D) to select persona.
+        user_prompt: The user message/prompt to send.
+        system_prompt_override: Optional override for the system prompt.
+
+    Returns:
+        List with the system and user messages.
+    """
+    system_prompt = _resolve_system_prompt(agent_id, system_prompt_override)
+
+    return [
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": user_prompt},
+    ]
+
+
+def build_response_format(response_model: type[BaseModel]) -> dict:
+    """
+    Build the strict json_schema response_format for a Pydantic model.
+
+    Response models forbid extra fields and declare every field required,
+    so model_json_schema() already satisfies strict mode. The result is
+    memoized per class so the schema is only walked once rather than on
+    every request.
+
+    Args:
+        response_model: Pydantic model class for structured output.
+
+    Returns:
+        response_format parameter dict. Shared between calls; do not mutate.
+    """
+    response_format = _RESPONSE_FORMAT_CACHE.get(response_model)
+    if response_format is None:
+        response_format = {
+            "type": "json_schema",
+            "json_schema": {
+                "name": response_model.__name__,
+                "schema": response_model.model_json_schema(),
+                "strict": True,
+            },
+        }
+        _RESPONSE_FORMAT_CACHE[response_model] = response_format
+    return response_format
+
+
+def _parse_content(content: str | None, response_model: type[T]) -> T:
+    """
+    Validate raw structured-output content against the response model.
+
+    Args:
+        content: Message content returned by the API.
+        response_model: Pydantic model class for structured output.
+
+    Returns:
+        Parsed response as an instance of the response_model.
+
+    Raises:
+        ValueError: If the content is missing or does not match the model.
+    """
+    if not content:
+        raise ValueError("Failed to parse response from GPT")
+    return response_model.model_validate_json(content)
+
+
+@_retry_transient_errors
 def call_gpt(
     client: OpenAI,
     agent_id: str,
     user_prompt: str,
     response_model: type[T],
     system_prompt_override: str | None = None,
+    use_cache: bool = False,
 ) -> T:
     """
     Call GPT-4o-mini with structured output parsing.
@@ -72,36 +331,130 @@ def call_gpt(
         response_model: Pydantic model class for structured output parsing.
         system_prompt_override: Optional override for the system prompt.
             If provided, replaces the persona-based system prompt.
+        use_cache: Whether to serve and store the response in the on-disk
+            cache. Only for calls whose answer depends on the prompt alone.
 
     Returns:
         Parsed response as an instance of the response_model.
 
     Raises:
-        ValueError: If agent_id is not found in PERSONAS.
-        Exception: If API call fails after all retry attempts.
+        ValueError: If agent_id is not found in PERSONAS or the response
+            cannot be parsed.
+        openai.APIError: If the API call fails, after retrying transient
+            errors (connection, timeout, rate limit, 5xx).
     """
-    if agent_id not in PERSONAS and system_prompt_override is None:
-        raise ValueError(
-            f"Unknown agent_id: {agent_id}. Must be one of {list(PERSONAS.keys())}"
-        )
+    messages = build_messages(agent_id, user_prompt, system_prompt_override)
 
-    system_prompt = (
-        system_prompt_override if system_prompt_override else PERSONAS[agent_id]
-    )
+    if use_cache:
+        key = _cache_key(messages, response_model)
+        cached = _cache_get(key, response_model)
+        if cached is not None:
+            return cached
 
-    logger.debug(f"Calling GPT for agent {agent_id} with model {MODEL_NAME}")
+    logger.debug("Calling GPT for agent %s with model %s", agent_id, MODEL_NAME)
 
-    completion = client.beta.chat.completions.parse(
+    completion = client.chat.completions.create(
         model=MODEL_NAME,
-        messages=[
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_prompt},
-        ],
-        response_format=response_model,
+        messages=messages,
+        response_format=build_response_format(response_model),
     )
 
-    parsed = completion.choices[0].message.parsed
-    if parsed is None:
-        raise ValueError("Failed to parse response from GPT")
+    parsed = _parse_content(completion.choices[0].message.content, response_model)
+
+    if use_cache:
+        _cache_set(key, parsed)
+
+    return parsed
+
+
+@_retry_transient_errors
+async def acall_gpt(
+    client: AsyncOpenAI,
+    agent_id: str,
+    user_prompt: str,
+    response_model: type[T],
+    system_prompt_override: str | None = None,
+    use_cache: bool = False,
+    on_field_complete: FieldCallback | None = None,
+) -> T:
+    """
+    Async variant of call_gpt for issuing independent calls concurrently.
+
+    Tenacity wraps coroutines with AsyncRetrying, so backoff sleeps yield to
+    the event loop instead of blocking other in-flight calls. Each attempt
+    holds a slot of the shared API semaphore only while the request is in
+    flight, so retries waiting on backoff do not starve other calls. Cache
+    reads and writes run in a worker thread to keep disk I/O off the loop.
+
+    The response is streamed, so callers can act on individual fields via
+    on_field_complete while later fields are still being decoded. If the
+    call is retried, fields are reported again for the new attempt.
+
+    Args:
+        client: AsyncOpenAI client instance.
+        agent_id: Agent identifier (A, B, C, or D) to select persona.
+        user_prompt: The user message/prompt to send.
+        response_model: Pydantic model class for structured output parsing.
+        system_prompt_override: Optional override for the system prompt.
+        use_cache: Whether to serve and store the response in the on-disk
+            cache. Only for calls whose answer depends on the prompt alone.
+        on_field_complete: Optional callback receiving (field_name, value)
+            as soon as each top-level response field is fully decoded.
+
+    Returns:
+        Parsed response as an instance of the response_model.
+
+    Raises:
+        ValueError: If agent_id is not found in PERSONAS or the response
+            cannot be parsed.
+        openai.APIError: If the API call fails, after retrying transient
+            errors (connection, timeout, rate limit, 5xx).
+    """
+    messages = build_messages(agent_id, user_prompt, system_prompt_override)
+    reported: set[str] = set()
+
+    if use_cache:
+        key = _cache_key(messages, response_model)
+        cached = await asyncio.to_thread(_cache_get, key, response_model)
+        if cached is not None:
+            if on_field_complete is not None:
+                _notify_completed_fields(
+                    cached.model_dump(), reported, on_field_complete, final=True
+                )
+            return cached
+
+    logger.debug(
+        "Calling GPT (async) for agent %s with model %s", agent_id, MODEL_NAME
+    )
+
+    content = ""
+    async with _get_api_semaphore():
+        stream = await client.chat.completions.create(
+            model=MODEL_NAME,
+            messages=messages,
+            response_format=build_response_format(response_model),
+            stream=True,
+        )
+        async with stream:
+            async for chunk in stream:
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if not delta:
+                    continue
+                content += delta
+
+                if on_field_complete is not None:
+                    partial = jiter.from_json(content.encode(), partial_mode=True)
+                    if isinstance(partial, dict):
+                        _notify_completed_fields(partial, reported, on_field_complete)
+
+    parsed = _parse_content(content, response_model)
+
+    if on_field_complete is not None:
+        _notify_completed_fields(
+            parsed.model_dump(), reported, on_field_complete, final=True
+        )
+
+    if use_cache:
+        await asyncio.to_thread(_cache_set, key, parsed)
 
     return parsed
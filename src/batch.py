@@ -0,0 +1,228 @@
+"""
+Batch module for the Multi-LLM Collaborative Debate System.
+
+Contains helpers for running independent structured-output calls through the
+OpenAI Batch API, which has its own rate-limit pool and half the cost of
+real-time requests at the expense of latency.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+
+import orjson
+from openai import AsyncOpenAI
+from openai.types import Batch
+from pydantic import BaseModel, ValidationError
+
+from src.agents import (
+    MODEL_NAME,
+    acall_gpt,
+    build_messages,
+    build_response_format,
+)
+
+logger = logging.getLogger(__name__)
+
+BATCH_ENDPOINT = "/v1/chat/completions"
+COMPLETION_WINDOW = "24h"
+
+# Polling backoff for batch status checks (seconds)
+POLL_INITIAL_INTERVAL = 10.0
+POLL_MAX_INTERVAL = 300.0
+POLL_BACKOFF_FACTOR = 1.5
+
+TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+
+@dataclass(frozen=True)
+class BatchCall:
+    """A single structured-output call to be submitted as part of a batch."""
+
+    custom_id: str
+    agent_id: str
+    user_prompt: str
+    response_model: type[BaseModel]
+    system_prompt_override: str | None = None
+
+    def to_request_line(self) -> dict:
+        """Serialize the call as one line of a Batch API input file."""
+        return {
+            "custom_id": self.custom_id,
+            "method": "POST",
+            "url": BATCH_ENDPOINT,
+            "body": {
+                "model": MODEL_NAME,
+                "messages": build_messages(
+                    self.agent_id, self.user_prompt, self.system_prompt_override
+                ),
+                "response_format": build_response_format(self.response_model),
+            },
+        }
+
+
+async def submit_batch(client: AsyncOpenAI, calls: list[BatchCall]) -> str:
+    """
+    Upload the calls as a JSONL input file and create a batch.
+
+    Args:
+        client: AsyncOpenAI client instance.
+        calls: Calls to include in the batch; custom_ids must be unique.
+
+    Returns:
+        The ID of the created batch.
+    """
+    payload = b"".join(orjson.dumps(call.to_request_line()) + b"\n" for call in calls)
+
+    input_file = await client.files.create(
+        file=("batch_input.jsonl", payload),
+        purpose="batch",
+    )
+    batch = await client.batches.create(
+        input_file_id=input_file.id,
+        endpoint=BATCH_ENDPOINT,
+        completion_window=COMPLETION_WINDOW,
+    )
+
+    logger.info("Submitted batch %s with %d requests", batch.id, len(calls))
+    return batch.id
+
+
+async def wait_for_batch(client: AsyncOpenAI, batch_id: str) -> Batch:
+    """
+    Poll a batch with exponential backoff until it reaches a terminal status.
+
+    Args:
+        client: AsyncOpenAI client instance.
+        batch_id: ID of the batch to wait for.
+
+    Returns:
+        The completed Batch object.
+
+    Raises:
+        RuntimeError: If the batch fails, expires, or is cancelled.
+    """
+    interval = POLL_INITIAL_INTERVAL
+
+    while True:
+        batch = await client.batches.retrieve(batch_id)
+        if batch.status in TERMINAL_STATUSES:
+            break
+
+        counts = batch.request_counts
+        if counts is not None:
+            logger.info(
+                "Batch %s %s: %d/%d done, checking again in %.0fs",
+                batch_id,
+                batch.status,
+                counts.completed,
+                counts.total,
+                interval,
+            )
+        await asyncio.sleep(interval)
+        interval = min(interval * POLL_BACKOFF_FACTOR, POLL_MAX_INTERVAL)
+
+    if batch.status != "completed":
+        raise RuntimeError(f"Batch {batch_id} ended with status '{batch.status}'")
+
+    return batch
+
+
+async def fetch_batch_results(
+    client: AsyncOpenAI,
+    batch: Batch,
+    calls: list[BatchCall],
+) -> dict[str, BaseModel]:
+    """
+    Download a completed batch's output and parse each response.
+
+    Requests that errored or returned unparseable content are left out of
+    the returned mapping.
+
+    Args:
+        client: AsyncOpenAI client instance.
+        batch: The completed Batch object.
+        calls: The calls that were submitted, used to look up response models.
+
+    Returns:
+        Dict mapping custom_id to the parsed response model instance.
+    """
+    if batch.output_file_id is None:
+        return {}
+
+    models_by_id = {call.custom_id: call.response_model for call in calls}
+    content = await client.files.content(batch.output_file_id)
+
+    results: dict[str, BaseModel] = {}
+    for line in content.content.splitlines():
+        if not line.strip():
+            continue
+
+        record = orjson.loads(line)
+        custom_id = record["custom_id"]
+        response = record.get("response") or {}
+
+        if record.get("error") or response.get("status_code") != 200:
+            logger.warning(
+                "Batch request %s failed: %s", custom_id, record.get("error")
+            )
+            continue
+
+        message = response["body"]["choices"][0]["message"]
+        try:
+            results[custom_id] = models_by_id[custom_id].model_validate_json(
+                message["content"] or ""
+            )
+        except ValidationError as e:
+            logger.warning("Batch request %s returned invalid output: %s", custom_id, e)
+
+    return results
+
+
+async def run_batch(
+    client: AsyncOpenAI, calls: list[BatchCall]
+) -> dict[str, BaseModel]:
+    """
+    Run calls through the Batch API, falling back to real-time for failures.
+
+    Any request missing from the batch output (errored or unparseable) is
+    retried with a regular acall_gpt so callers always get a full mapping.
+
+    Args:
+        client: AsyncOpenAI client instance.
+        calls: Calls to run; custom_ids must be unique.
+
+    Returns:
+        Dict mapping custom_id to the parsed response model instance.
+    """
+    if not calls:
+        return {}
+
+    batch_id = await submit_batch(client, calls)
+    batch = await wait_for_batch(client, batch_id)
+    results = await fetch_batch_results(client, batch, calls)
+
+    missing = [call for call in calls if call.custom_id not in results]
+    if missing:
+        logger.warning(
+            "Batch %s: %d requests missing, retrying in real time",
+            batch_id,
+            len(missing),
+        )
+        retried = await asyncio.gather(
+            *(
+                acall_gpt(
+                    client,
+                    call.agent_id,
+                    call.user_prompt,
+                    call.response_model,
+                    system_prompt_override=call.system_prompt_override,
+                )
+                for call in missing
+            )
+        )
+        results.update(
+            (call.custom_id, parsed) for call, parsed in zip(missing, retried)
+        )
+
+    return results
@@ -1,29 +1,46 @@
+from datetime import datetime
 from typing import Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
-class RolePreference(BaseModel):
-    agent_id: str
+class DebateModel(BaseModel):
+    # Records are never mutated after parsing; freezing them (and rejecting
+    # unknown fields) catches accidental edits and malformed payloads early.
+    # Forbidding extras also keeps model_json_schema() valid for OpenAI's
+    # strict structured outputs, as long as response fields have no defaults.
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+
+# Agent identifiers, matching the keys of src.agents.PERSONAS
+AgentId = Literal["A", "B", "C", "D"]
+
+
+class RolePreference(DebateModel):
+    agent_id: AgentId
     role_priority: Literal["Solver", "Judge"]
     confidence: float = Field(description="Between 0.0 and 1.0")
     reasoning: str
 
 
-class Solution(BaseModel):
+class RolePreferences(DebateModel):
+    items: list[RolePreference] = Field(description="One entry per persona")
+
+
+class Solution(DebateModel):
     solution_text: str = Field(description="Step-by-step reasoning")
     final_answer: str = Field(
         description="The concise final answer (e.g., '42', 'Option B')"
     )
 
 
-class CritiqueError(BaseModel):
+class CritiqueError(DebateModel):
     location: str = Field(description="Where the error occurred (e.g., 'Step 3')")
     description: str
     severity: Literal["minor", "critical"]
 
 
-class PeerReview(BaseModel):
+class PeerReview(DebateModel):
     reviewer_id: str
     target_solver_id: str
     strengths: list[str]
@@ -32,18 +49,42 @@ class PeerReview(BaseModel):
     score: int = Field(description="Quality score out of 10")
 
 
-class RefinedSolution(BaseModel):
+class RefinedSolution(DebateModel):
     changes_made: str = Field(description="Summary of changes based on feedback")
     solution_text: str = Field(description="The improved step-by-step reasoning")
     final_answer: str
 
 
-class JudgeVerdict(BaseModel):
+class JudgeVerdict(DebateModel):
     best_solver_id: str
-    rationale: str
+    # Decoded before the rationale so grading can start while it streams
     final_answer_to_user: str
+    rationale: str
 
 
-class EvaluationResult(BaseModel):
+class EvaluationResult(DebateModel):
     is_correct: bool
     reasoning: str
+
+
+class ResultRecord(DebateModel):
+    problem_id: int
+    category: str | None = None
+    difficulty: str | None = None
+    question: str
+    ground_truth: str
+    role_preferences: list[RolePreference]
+    judge_id: str
+    solver_ids: list[str]
+    initial_solutions: dict[str, Solution]
+    reviews: dict[str, list[PeerReview]]
+    refined_solutions: dict[str, RefinedSolution]
+    verdict: JudgeVerdict
+    evaluation: EvaluationResult
+    timestamp: datetime = Field(default_factory=datetime.now)
+
+
+class ErrorRecord(DebateModel):
+    problem_id: int
+    error: str
+    timestamp: datetime = Field(default_factory=datetime.now)
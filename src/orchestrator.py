@@ -4,23 +4,63 @@ Orchestrator module for the Multi-LLM Collaborative Debate System.
 Contains the stage functions that drive the debate workflow.
 """
 
+import asyncio
 import logging
+from decimal import Decimal, InvalidOperation
+from fractions import Fraction
 
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 
-from src.agents import call_gpt
+from src.agents import PERSONAS, FieldCallback, acall_gpt, call_gpt
+from src.batch import BatchCall, run_batch
 from src.models import (
     EvaluationResult,
     JudgeVerdict,
     PeerReview,
     RefinedSolution,
     RolePreference,
+    RolePreferences,
     Solution,
 )
 
 logger = logging.getLogger(__name__)
 
 
+def _batch_custom_id(problem_id: int, agent_id: str, stage: str) -> str:
+    """Build a Batch API custom_id encoding (problem_id, agent_id, stage)."""
+    return f"{problem_id}:{agent_id}:{stage}"
+
+
+# Static prompt text goes first so every call with the same system prompt
+# shares a byte-identical prefix, which OpenAI's automatic prompt caching
+# can reuse; per-call content is appended after it.
+_ROLE_PREF_PREFIX = """Analyze the following problem and decide whether you would be better suited as a Solver or a Judge.
+
+As a **Solver**, you will:
+- Generate an independent solution to the problem
+- Receive critiques from other solvers
+- Refine your solution based on feedback
+
+As a **Judge**, you will:
+- Observe all solutions and critiques
+- Evaluate the quality of reasoning
+- Select the best final answer
+
+Consider your strengths and the nature of this problem. Provide your role preference with a confidence score (0.0 to 1.0) and reasoning.
+
+**Problem:**
+"""
+
+_ROLE_PREF_SUFFIX = """
+
+Your agent_id is: {agent_id}"""
+
+
+def _role_preference_prompt(agent_id: str, question: str) -> str:
+    """Build the Stage 0 role preference prompt."""
+    return _ROLE_PREF_PREFIX + question + _ROLE_PREF_SUFFIX.format(agent_id=agent_id)
+
+
 def get_role_preference(client: OpenAI, agent_id: str, question: str) -> RolePreference:
     """
     Stage 0: Get an agent's role preference (Solver vs Judge).
@@ -32,27 +72,182 @@ def get_role_preference(client: OpenAI, agent_id: str, question: str) -> RolePre
 
     Returns:
         RolePreference indicating the agent's preferred role and confidence.
+        Served from the on-disk cache when the same agent saw the same question.
     """
-    prompt = f"""Analyze the following problem and decide whether you would be better suited as a Solver or a Judge.
+    prompt = _role_preference_prompt(agent_id, question)
 
-**Problem:**
-{question}
+    return call_gpt(client, agent_id, prompt, RolePreference, use_cache=True)
 
-As a **Solver**, you will:
+
+async def aget_role_preference(
+    client: AsyncOpenAI, agent_id: str, question: str
+) -> RolePreference:
+    """
+    Stage 0 (async): Get an agent's role preference (Solver vs Judge).
+
+    Args:
+        client: AsyncOpenAI client instance.
+        agent_id: Agent identifier (A, B, C, or D).
+        question: The problem question to analyze.
+
+    Returns:
+        RolePreference indicating the agent's preferred role and confidence.
+        Served from the on-disk cache when the same agent saw the same question.
+    """
+    prompt = _role_preference_prompt(agent_id, question)
+
+    return await acall_gpt(client, agent_id, prompt, RolePreference, use_cache=True)
+
+
+# Stage 0 preferences are cheap meta-reasoning, so one call role-plays every
+# persona at once instead of making a separate call per agent.
+COMMITTEE_AGENT_ID = "committee"
+
+COMMITTEE_SYSTEM_PROMPT = (
+    "You are simulating a committee of independent agents, each with its own "
+    "persona. Answer separately for each persona, in that persona's voice, "
+    "without letting the other personas influence its choice.\n\n"
+    + "\n".join(f"Agent {aid}: {persona}" for aid, persona in PERSONAS.items())
+)
+
+_COMMITTEE_PREF_PREFIX = """For each of the agents described in the system message, decide whether that agent would be better suited as a Solver or a Judge for the problem below.
+
+As a **Solver**, an agent will:
 - Generate an independent solution to the problem
 - Receive critiques from other solvers
-- Refine your solution based on feedback
+- Refine its solution based on feedback
 
-As a **Judge**, you will:
+As a **Judge**, an agent will:
 - Observe all solutions and critiques
 - Evaluate the quality of reasoning
 - Select the best final answer
 
-Consider your strengths and the nature of this problem. Provide your role preference with a confidence score (0.0 to 1.0) and reasoning.
+Output exactly one role preference per agent, each with that agent's agent_id, a confidence score (0.0 to 1.0) and reasoning.
 
-Your agent_id is: {agent_id}"""
+**Problem:**
+"""
+
+
+def _committee_preference_prompt(question: str) -> str:
+    """Build the Stage 0 role preference prompt covering every agent."""
+    return _COMMITTEE_PREF_PREFIX + question
+
+
+async def _complete_preferences(
+    client: AsyncOpenAI, committee: RolePreferences, question: str
+) -> list[RolePreference]:
+    """
+    Order committee preferences by agent, asking agents it skipped directly.
+
+    Args:
+        client: AsyncOpenAI client instance.
+        committee: Preferences returned by a committee call.
+        question: The problem question the preferences are for.
+
+    Returns:
+        RolePreferences of all agents, in PERSONAS order.
+    """
+    by_agent: dict[str, RolePreference] = {}
+    for pref in committee.items:
+        if pref.agent_id in PERSONAS:
+            by_agent.setdefault(pref.agent_id, pref)
+
+    missing = [agent_id for agent_id in PERSONAS if agent_id not in by_agent]
+    if missing:
+        logger.warning(
+            "Committee call skipped agents %s, asking them individually", missing
+        )
+        fetched = await asyncio.gather(
+            *(aget_role_preference(client, a, question) for a in missing)
+        )
+        by_agent.update(zip(missing, fetched))
+
+    return [by_agent[agent_id] for agent_id in PERSONAS]
+
+
+async def aget_role_preferences(
+    client: AsyncOpenAI, question: str
+) -> list[RolePreference]:
+    """
+    Stage 0 (async): Get every agent's role preference in one committee call.
+
+    Args:
+        client: AsyncOpenAI client instance.
+        question: The problem question to analyze.
+
+    Returns:
+        RolePreferences of all agents, in PERSONAS order. Served from the
+        on-disk cache when the same question was seen before.
+    """
+    committee = await acall_gpt(
+        client,
+        COMMITTEE_AGENT_ID,
+        _committee_preference_prompt(question),
+        RolePreferences,
+        system_prompt_override=COMMITTEE_SYSTEM_PROMPT,
+        use_cache=True,
+    )
 
-    return call_gpt(client, agent_id, prompt, RolePreference)
+    return await _complete_preferences(client, committee, question)
+
+
+async def abatch_role_preferences(
+    client: AsyncOpenAI, problems: list[dict]
+) -> dict[int, list[RolePreference]]:
+    """
+    Stage 0 (Batch API): Get every agent's role preference for many problems.
+
+    Submits one committee call per problem.
+
+    Args:
+        client: AsyncOpenAI client instance.
+        problems: Problem dictionaries with 'id' and 'question'.
+
+    Returns:
+        Dict mapping problem ID to the RolePreferences of all agents, in
+        PERSONAS order.
+    """
+    calls = [
+        BatchCall(
+            custom_id=_batch_custom_id(problem["id"], COMMITTEE_AGENT_ID, "role_pref"),
+            agent_id=COMMITTEE_AGENT_ID,
+            user_prompt=_committee_preference_prompt(problem["question"]),
+            response_model=RolePreferences,
+            system_prompt_override=COMMITTEE_SYSTEM_PROMPT,
+        )
+        for problem in problems
+    ]
+
+    results = await run_batch(client, calls)
+
+    preferences = await asyncio.gather(
+        *(
+            _complete_preferences(
+                client,
+                results[call.custom_id],
+                problem["question"],
+            )
+            for call, problem in zip(calls, problems)
+        )
+    )
+
+    return {
+        problem["id"]: problem_preferences
+        for problem, problem_preferences in zip(problems, preferences)
+    }
+
+
+_SOLUTION_PREFIX = """Solve the following problem step by step.
+
+Provide your complete reasoning process and a clear final answer. Be thorough in your analysis.
+
+**Problem:**
+"""
+
+
+def _solution_prompt(question: str) -> str:
+    """Build the Stage 1 independent solution prompt."""
+    return _SOLUTION_PREFIX + question
 
 
 def generate_solution(client: OpenAI, agent_id: str, question: str) -> Solution:
@@ -67,14 +262,123 @@ def generate_solution(client: OpenAI, agent_id: str, question: str) -> Solution:
     Returns:
         Solution containing step-by-step reasoning and final answer.
     """
-    prompt = f"""Solve the following problem step by step.
+    prompt = _solution_prompt(question)
+
+    return call_gpt(client, agent_id, prompt, Solution)
+
+
+async def agenerate_solution(
+    client: AsyncOpenAI, agent_id: str, question: str
+) -> Solution:
+    """
+    Stage 1 (async): Generate an independent solution to the problem.
+
+    Args:
+        client: AsyncOpenAI client instance.
+        agent_id: Agent identifier (A, B, C, or D).
+        question: The problem question to solve.
+
+    Returns:
+        Solution containing step-by-step reasoning and final answer.
+    """
+    prompt = _solution_prompt(question)
+
+    return await acall_gpt(client, agent_id, prompt, Solution)
+
+
+async def abatch_solutions(
+    client: AsyncOpenAI,
+    problems: list[dict],
+    solver_ids_by_problem: dict[int, list[str]],
+) -> dict[int, dict[str, Solution]]:
+    """
+    Stage 1 (Batch API): Generate independent solutions for many problems.
+
+    Args:
+        client: AsyncOpenAI client instance.
+        problems: Problem dictionaries with 'id' and 'question'.
+        solver_ids_by_problem: Dict mapping problem ID to its solver IDs.
+
+    Returns:
+        Dict mapping problem ID to a dict of solver_id to Solution.
+    """
+    calls = [
+        BatchCall(
+            custom_id=_batch_custom_id(problem["id"], solver_id, "solution"),
+            agent_id=solver_id,
+            user_prompt=_solution_prompt(problem["question"]),
+            response_model=Solution,
+        )
+        for problem in problems
+        for solver_id in solver_ids_by_problem[problem["id"]]
+    ]
+
+    results = await run_batch(client, calls)
+
+    return {
+        problem["id"]: {
+            solver_id: results[_batch_custom_id(problem["id"], solver_id, "solution")]
+            for solver_id in solver_ids_by_problem[problem["id"]]
+        }
+        for problem in problems
+    }
+
+
+# Stage 2 puts everything that is the same for all reviewers of a solution in
+# the system message ahead of the reviewer's persona, so the reviews of one
+# target share a cacheable prefix; only the persona and the short user
+# message differ between reviewers.
+_CRITIQUE_SYSTEM_PREFIX = """You are reviewing the following solution to the given problem as part of a peer review.
+
+Analyze this solution carefully:
+1. Identify strengths in the reasoning
+2. Identify weaknesses or gaps
+3. Point out any specific errors (note the location, e.g., "Step 3")
+4. Assign a quality score out of 10
 
 **Problem:**
-{question}
+"""
 
-Provide your complete reasoning process and a clear final answer. Be thorough in your analysis."""
+_CRITIQUE_SYSTEM_SUFFIX = """
 
-    return call_gpt(client, agent_id, prompt, Solution)
+**Solution by Solver {target_solver_id}:**
+{solution_text}
+
+**Their Final Answer:** {final_answer}
+
+**Your Persona:**
+{persona}"""
+
+_CRITIQUE_PROMPT = """Provide a thorough critique of the solution.
+
+Your reviewer_id is: {reviewer_id}
+The target_solver_id is: {target_solver_id}"""
+
+
+def _critique_system_prompt(
+    reviewer_id: str,
+    target_solver_id: str,
+    question: str,
+    solution: Solution,
+) -> str:
+    """Build the Stage 2 system prompt holding the problem and target solution."""
+    return (
+        _CRITIQUE_SYSTEM_PREFIX
+        + question
+        + _CRITIQUE_SYSTEM_SUFFIX.format(
+            target_solver_id=target_solver_id,
+            solution_text=solution.solution_text,
+            final_answer=solution.final_answer,
+            persona=PERSONAS[reviewer_id],
+        )
+    )
+
+
+def _critique_prompt(reviewer_id: str, target_solver_id: str) -> str:
+    """Build the short Stage 2 peer review instruction."""
+    return _CRITIQUE_PROMPT.format(
+        reviewer_id=reviewer_id, target_solver_id=target_solver_id
+    )
 
 
 def generate_critique(
@@ -97,26 +401,97 @@ def generate_critique(
     Returns:
         PeerReview containing strengths, weaknesses, errors, and score.
     """
-    prompt = f"""Review the following solution to the given problem. Provide a thorough critique.
+    system_prompt = _critique_system_prompt(
+        reviewer_id, target_solver_id, question, solution
+    )
+    prompt = _critique_prompt(reviewer_id, target_solver_id)
 
-**Problem:**
-{question}
+    return call_gpt(
+        client,
+        reviewer_id,
+        prompt,
+        PeerReview,
+        system_prompt_override=system_prompt,
+    )
 
-**Solution by Solver {target_solver_id}:**
-{solution.solution_text}
 
-**Their Final Answer:** {solution.final_answer}
+async def agenerate_critique(
+    client: AsyncOpenAI,
+    reviewer_id: str,
+    target_solver_id: str,
+    question: str,
+    solution: Solution,
+) -> PeerReview:
+    """
+    Stage 2 (async): Generate a peer review critique of another solver's solution.
 
-Analyze this solution carefully:
-1. Identify strengths in the reasoning
-2. Identify weaknesses or gaps
-3. Point out any specific errors (note the location, e.g., "Step 3")
-4. Assign a quality score out of 10
+    Args:
+        client: AsyncOpenAI client instance.
+        reviewer_id: Agent ID of the reviewer.
+        target_solver_id: Agent ID of the solver being reviewed.
+        question: The original problem question.
+        solution: The solution to critique.
 
-Your reviewer_id is: {reviewer_id}
-The target_solver_id is: {target_solver_id}"""
+    Returns:
+        PeerReview containing strengths, weaknesses, errors, and score.
+    """
+    system_prompt = _critique_system_prompt(
+        reviewer_id, target_solver_id, question, solution
+    )
+    prompt = _critique_prompt(reviewer_id, target_solver_id)
+
+    return await acall_gpt(
+        client,
+        reviewer_id,
+        prompt,
+        PeerReview,
+        system_prompt_override=system_prompt,
+    )
+
+
+_REFINEMENT_PREFIX = """Refine your solution based on the peer feedback you received.
+
+Address the critiques, fix any errors identified, and improve your solution. Clearly state what changes you made.
 
-    return call_gpt(client, reviewer_id, prompt, PeerReview)
+**Original Problem:**
+"""
+
+_REFINEMENT_SUFFIX = """
+
+**Your Original Solution:**
+{solution_text}
+
+**Your Original Answer:** {final_answer}
+
+**Peer Reviews Received:**
+{reviews_text}"""
+
+
+def _refinement_prompt(
+    question: str,
+    original_solution: Solution,
+    reviews: list[PeerReview],
+) -> str:
+    """Build the Stage 3 refinement prompt."""
+    reviews_text = ""
+    for i, review in enumerate(reviews, 1):
+        reviews_text += f"""
+**Review {i} (from Reviewer {review.reviewer_id}):**
+- Strengths: {", ".join(review.strengths) if review.strengths else "None listed"}
+- Weaknesses: {", ".join(review.weaknesses) if review.weaknesses else "None listed"}
+- Errors: {"; ".join(f"{e.location}: {e.description} ({e.severity})" for e in review.errors) if review.errors else "None found"}
+- Score: {review.score}/10
+"""
+
+    return (
+        _REFINEMENT_PREFIX
+        + question
+        + _REFINEMENT_SUFFIX.format(
+            solution_text=original_solution.solution_text,
+            final_answer=original_solution.final_answer,
+            reviews_text=reviews_text,
+        )
+    )
 
 
 def refine_solution(
@@ -139,32 +514,117 @@ def refine_solution(
     Returns:
         RefinedSolution with improvements based on feedback.
     """
-    reviews_text = ""
-    for i, review in enumerate(reviews, 1):
-        reviews_text += f"""
-**Review {i} (from Reviewer {review.reviewer_id}):**
-- Strengths: {", ".join(review.strengths) if review.strengths else "None listed"}
-- Weaknesses: {", ".join(review.weaknesses) if review.weaknesses else "None listed"}
-- Errors: {"; ".join(f"{e.location}: {e.description} ({e.severity})" for e in review.errors) if review.errors else "None found"}
-- Score: {review.score}/10
+    prompt = _refinement_prompt(question, original_solution, reviews)
+
+    return call_gpt(client, agent_id, prompt, RefinedSolution)
+
+
+async def arefine_solution(
+    client: AsyncOpenAI,
+    agent_id: str,
+    question: str,
+    original_solution: Solution,
+    reviews: list[PeerReview],
+) -> RefinedSolution:
+    """
+    Stage 3 (async): Refine solution based on peer review feedback.
+
+    Args:
+        client: AsyncOpenAI client instance.
+        agent_id: Agent identifier (A, B, C, or D).
+        question: The original problem question.
+        original_solution: The solver's initial solution.
+        reviews: List of peer reviews received.
+
+    Returns:
+        RefinedSolution with improvements based on feedback.
+    """
+    prompt = _refinement_prompt(question, original_solution, reviews)
+
+    return await acall_gpt(client, agent_id, prompt, RefinedSolution)
+
+
+JUDGE_SYSTEM_PROMPT = (
+    "You are an impartial judge evaluating a multi-agent debate. "
+    "Your role is to carefully analyze all solutions, consider the critiques made, "
+    "and select the solver with the best final answer. Focus on correctness, "
+    "reasoning quality, and how well each solver addressed feedback."
+)
+
+GRADER_SYSTEM_PROMPT = (
+    "You are an expert grader evaluating answers to complex problems. "
+    "Your job is to determine if the given answer is correct by comparing it "
+    "to the ground truth. Be fair but rigorous. Consider semantic equivalence - "
+    "answers may be phrased differently but still be correct."
+)
+
+# Use agent D (balanced synthesizer) for grading
+GRADER_AGENT_ID = "D"
+
+
+_JUDGE_PREFIX = """Evaluate the following debate and select the best solver.
+
+Select the solver with the best final answer. Provide your rationale and state the final answer to present to the user.
+
+**Problem:**
 """
 
-    prompt = f"""Refine your solution based on the peer feedback you received.
+_JUDGE_SUFFIX = """
 
-**Original Problem:**
-{question}
+**Debate History:**
+{debate_history}"""
 
-**Your Original Solution:**
-{original_solution.solution_text}
 
-**Your Original Answer:** {original_solution.final_answer}
+def _first_sentence(items: list[str]) -> str:
+    """Return the first sentence of the first item, or "None" if empty."""
+    if not items:
+        return "None"
+    return items[0].split(". ")[0].rstrip(".")
 
-**Peer Reviews Received:**
-{reviews_text}
 
-Address the critiques, fix any errors identified, and improve your solution. Clearly state what changes you made."""
+def _judge_prompt(
+    question: str,
+    solver_ids: list[str],
+    initial_solutions: dict[str, Solution],
+    reviews: dict[str, list[PeerReview]],
+    refined_solutions: dict[str, RefinedSolution],
+) -> str:
+    """
+    Build the Stage 4 judge prompt from a compacted debate history.
 
-    return call_gpt(client, agent_id, prompt, RefinedSolution)
+    Each review is reduced to its score, error count, and one-sentence top
+    strength and weakness; the refinement already addresses the full
+    critiques. The initial solution text is only included when the solver
+    changed its answer, since otherwise the refined solution subsumes it.
+    """
+    parts: list[str] = []
+    for solver_id in solver_ids:
+        initial = initial_solutions[solver_id]
+        refined = refined_solutions[solver_id]
+
+        parts.append(f"\n=== SOLVER {solver_id} ===\n\n")
+        if initial.final_answer != refined.final_answer:
+            parts.append(f"**Initial Solution:**\n{initial.solution_text}\n")
+        parts.append(f"**Initial Answer:** {initial.final_answer}\n\n")
+
+        parts.append("**Reviews (score, errors, top strength / weakness):**\n")
+        for review in reviews[solver_id]:
+            parts.append(
+                f"- Reviewer {review.reviewer_id}: {review.score}/10,"
+                f" {len(review.errors)} errors"
+                f" | + {_first_sentence(review.strengths)}"
+                f" | - {_first_sentence(review.weaknesses)}\n"
+            )
+
+        parts.append(
+            f"\n**Refined Solution:**\n{refined.solution_text}\n"
+            f"**Refined Answer:** {refined.final_answer}\n"
+            f"**Changes Made:** {refined.changes_made}\n\n"
+        )
+
+    return _JUDGE_PREFIX + question + _JUDGE_SUFFIX.format(
+        debate_history="".join(parts)
+    )
 
 
 def judge_verdict(
@@ -191,63 +651,194 @@ def judge_verdict(
     Returns:
         JudgeVerdict with the winning solver and final answer.
     """
-    debate_history = ""
-    for solver_id in solver_ids:
-        initial = initial_solutions[solver_id]
-        refined = refined_solutions[solver_id]
-        solver_reviews = reviews[solver_id]
+    prompt = _judge_prompt(
+        question, solver_ids, initial_solutions, reviews, refined_solutions
+    )
 
-        debate_history += f"""
-=== SOLVER {solver_id} ===
+    return call_gpt(
+        client,
+        judge_id,
+        prompt,
+        JudgeVerdict,
+        system_prompt_override=JUDGE_SYSTEM_PROMPT,
+    )
 
-**Initial Solution:**
-{initial.solution_text}
-**Initial Answer:** {initial.final_answer}
 
-**Reviews Received:**
-"""
-        for review in solver_reviews:
-            debate_history += f"""
-- From Reviewer {review.reviewer_id}: Score {review.score}/10
-  Strengths: {", ".join(review.strengths) if review.strengths else "None"}
-  Weaknesses: {", ".join(review.weaknesses) if review.weaknesses else "None"}
-  Errors: {len(review.errors)} identified
-"""
+async def ajudge_verdict(
+    client: AsyncOpenAI,
+    judge_id: str,
+    question: str,
+    solver_ids: list[str],
+    initial_solutions: dict[str, Solution],
+    reviews: dict[str, list[PeerReview]],
+    refined_solutions: dict[str, RefinedSolution],
+    on_field_complete: FieldCallback | None = None,
+) -> JudgeVerdict:
+    """
+    Stage 4 (async): Judge evaluates all solutions and selects the winner.
 
-        debate_history += f"""
-**Refined Solution:**
-{refined.solution_text}
-**Refined Answer:** {refined.final_answer}
-**Changes Made:** {refined.changes_made}
+    Args:
+        client: AsyncOpenAI client instance.
+        judge_id: Agent ID of the judge.
+        question: The original problem question.
+        solver_ids: List of solver agent IDs.
+        initial_solutions: Dict mapping solver_id to their initial Solution.
+        reviews: Dict mapping solver_id to list of PeerReviews they received.
+        refined_solutions: Dict mapping solver_id to their RefinedSolution.
+        on_field_complete: Optional callback receiving (field_name, value) as
+            each verdict field finishes streaming, e.g. to start grading
+            final_answer_to_user before the rationale is done.
 
-"""
+    Returns:
+        JudgeVerdict with the winning solver and final answer.
+    """
+    prompt = _judge_prompt(
+        question, solver_ids, initial_solutions, reviews, refined_solutions
+    )
 
-    judge_system_prompt = (
-        "You are an impartial judge evaluating a multi-agent debate. "
-        "Your role is to carefully analyze all solutions, consider the critiques made, "
-        "and select the solver with the best final answer. Focus on correctness, "
-        "reasoning quality, and how well each solver addressed feedback."
+    return await acall_gpt(
+        client,
+        judge_id,
+        prompt,
+        JudgeVerdict,
+        system_prompt_override=JUDGE_SYSTEM_PROMPT,
+        on_field_complete=on_field_complete,
     )
 
-    prompt = f"""Evaluate the following debate and select the best solver.
+
+_GRADING_PREFIX = """Evaluate whether the given answer is correct.
+
+Determine if the answer is correct. Consider:
+- Semantic equivalence (different phrasing, same meaning)
+- Mathematical equivalence (e.g., "1/2" vs "0.5")
+- Partial credit is NOT allowed - the answer is either correct or incorrect
+
+Provide your reasoning and final verdict.
 
 **Problem:**
-{question}
+"""
 
-**Debate History:**
-{debate_history}
+_GRADING_SUFFIX = """
 
-Select the solver with the best final answer. Provide your rationale and state the final answer to present to the user."""
+**Ground Truth (Correct Answer):**
+{ground_truth}
 
-    return call_gpt(
-        client,
-        judge_id,
-        prompt,
-        JudgeVerdict,
-        system_prompt_override=judge_system_prompt,
+**Answer to Evaluate:**
+{final_answer}"""
+
+
+def _grading_prompt(question: str, ground_truth: str, final_answer: str) -> str:
+    """Build the grading prompt comparing an answer to the ground truth."""
+    return (
+        _GRADING_PREFIX
+        + question
+        + _GRADING_SUFFIX.format(ground_truth=ground_truth, final_answer=final_answer)
     )
 
 
+def _normalize_answer(answer: str) -> str:
+    """Collapse whitespace and case so trivially equal answers compare equal."""
+    return " ".join(answer.split()).lower()
+
+
+# Minimum significant digits a decimal answer needs before it is accepted as
+# a rounded form of an exact value (e.g. "0.333333" for "1/3"); shorter
+# decimals like "0.2" are ambiguous and left to the grader.
+MIN_APPROX_SIGNIFICANT_DIGITS = 6
+
+
+def _parse_number(answer: str) -> tuple[Fraction, Decimal | None] | None:
+    """
+    Parse an integer, decimal, or a/b fraction answer.
+
+    Args:
+        answer: Answer text to parse.
+
+    Returns:
+        The exact value and, if the answer is written with decimal places,
+        its Decimal form (None for integers and fractions), or None if the
+        answer is not numeric.
+    """
+    text = answer.replace(" ", "")
+    try:
+        value = Fraction(text)
+    except (ValueError, ZeroDivisionError):
+        return None
+
+    try:
+        decimal = Decimal(text)
+    except InvalidOperation:
+        # a/b fractions are exact
+        return value, None
+
+    return value, decimal if decimal.as_tuple().exponent < 0 else None
+
+
+def _is_rounded_form(decimal: Decimal, value: Fraction) -> bool:
+    """
+    Check whether a decimal is an unambiguous rounding of an exact value.
+
+    Args:
+        decimal: Decimal answer that may have been rounded.
+        value: Exact value it is compared against.
+
+    Returns:
+        True if the decimal has at least MIN_APPROX_SIGNIFICANT_DIGITS
+        significant digits and is within half a unit of its last place.
+    """
+    digits = decimal.as_tuple()
+    if len(digits.digits) < MIN_APPROX_SIGNIFICANT_DIGITS:
+        return False
+
+    half_unit = Fraction(1, 2 * 10 ** -digits.exponent)
+    return abs(Fraction(decimal) - value) <= half_unit
+
+
+def _match_answer(ground_truth: str, final_answer: str) -> EvaluationResult | None:
+    """
+    Grade answers that are obviously correct without calling the grader.
+
+    Only matches that cannot be false positives are graded here: equal
+    values, or a decimal with enough significant digits to be an
+    unambiguous rounding of an exact integer or fraction on the other side
+    (e.g. "0.3333333333" for "1/3"). Everything else goes to the grader.
+
+    Args:
+        ground_truth: The correct answer.
+        final_answer: The system's final answer to evaluate.
+
+    Returns:
+        A correct EvaluationResult if the answers are equal after
+        normalization or numerically equal, otherwise None.
+    """
+    if _normalize_answer(final_answer) == _normalize_answer(ground_truth):
+        return EvaluationResult(is_correct=True, reasoning="Exact match")
+
+    expected = _parse_number(ground_truth)
+    actual = _parse_number(final_answer)
+    if expected is None or actual is None:
+        return None
+
+    expected_value, expected_decimal = expected
+    actual_value, actual_decimal = actual
+    if expected_value == actual_value:
+        return EvaluationResult(is_correct=True, reasoning="Numeric match")
+
+    # Two exact values or two decimals that differ are different answers
+    if (expected_decimal is None) == (actual_decimal is None):
+        return None
+
+    if actual_decimal is not None:
+        is_match = _is_rounded_form(actual_decimal, expected_value)
+    else:
+        is_match = _is_rounded_form(expected_decimal, actual_value)
+
+    if is_match:
+        return EvaluationResult(is_correct=True, reasoning="Numeric match")
+
+    return None
+
+
 def grade_answer(
     client: OpenAI,
     question: str,
@@ -264,37 +855,59 @@ def grade_answer(
         final_answer: The system's final answer to evaluate.
 
     Returns:
-        EvaluationResult indicating correctness and reasoning.
+        EvaluationResult indicating correctness and reasoning. Answers that
+        match the ground truth exactly or numerically are graded without an
+        API call; others are served from the on-disk cache when the same
+        answer was already graded.
     """
-    grader_system_prompt = (
-        "You are an expert grader evaluating answers to complex problems. "
-        "Your job is to determine if the given answer is correct by comparing it "
-        "to the ground truth. Be fair but rigorous. Consider semantic equivalence - "
-        "answers may be phrased differently but still be correct."
-    )
+    match = _match_answer(ground_truth, final_answer)
+    if match is not None:
+        return match
 
-    prompt = f"""Evaluate whether the given answer is correct.
+    prompt = _grading_prompt(question, ground_truth, final_answer)
 
-**Problem:**
-{question}
+    return call_gpt(
+        client,
+        GRADER_AGENT_ID,
+        prompt,
+        EvaluationResult,
+        system_prompt_override=GRADER_SYSTEM_PROMPT,
+        use_cache=True,
+    )
 
-**Ground Truth (Correct Answer):**
-{ground_truth}
 
-**Answer to Evaluate:**
-{final_answer}
+async def agrade_answer(
+    client: AsyncOpenAI,
+    question: str,
+    ground_truth: str,
+    final_answer: str,
+) -> EvaluationResult:
+    """
+    Grade the final answer against the ground truth using LLM-as-a-Judge (async).
 
-Determine if the answer is correct. Consider:
-- Semantic equivalence (different phrasing, same meaning)
-- Mathematical equivalence (e.g., "1/2" vs "0.5")
-- Partial credit is NOT allowed - the answer is either correct or incorrect
+    Args:
+        client: AsyncOpenAI client instance.
+        question: The original problem question.
+        ground_truth: The correct answer.
+        final_answer: The system's final answer to evaluate.
 
-Provide your reasoning and final verdict."""
+    Returns:
+        EvaluationResult indicating correctness and reasoning. Answers that
+        match the ground truth exactly or numerically are graded without an
+        API call; others are served from the on-disk cache when the same
+        answer was already graded.
+    """
+    match = _match_answer(ground_truth, final_answer)
+    if match is not None:
+        return match
 
-    return call_gpt(
+    prompt = _grading_prompt(question, ground_truth, final_answer)
+
+    return await acall_gpt(
         client,
-        "D",  # Use agent D (balanced synthesizer) for grading
+        GRADER_AGENT_ID,
         prompt,
         EvaluationResult,
-        system_prompt_override=grader_system_prompt,
+        system_prompt_override=GRADER_SYSTEM_PROMPT,
+        use_cache=True,
     )
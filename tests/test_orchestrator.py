@@ -0,0 +1,49 @@
+import pytest
+
+from src.orchestrator import _match_answer
+
+
+@pytest.mark.parametrize(
+    ("ground_truth", "final_answer"),
+    [
+        ("July 16", " july  16 "),
+        ("2/3", "2/3"),
+        ("7/16", "0.4375"),
+        ("01", "1"),
+        ("1e3", "1000"),
+        ("12.9", "12.90"),
+        ("1/3", "0.3333333333"),
+        ("0.3333333333", "1/3"),
+        ("2/3", "0.666667"),
+    ],
+)
+def test_match_answer_accepts_equal_answers(ground_truth, final_answer):
+    result = _match_answer(ground_truth, final_answer)
+
+    assert result is not None
+    assert result.is_correct
+
+
+@pytest.mark.parametrize(
+    ("ground_truth", "final_answer"),
+    [
+        # Short decimals are ambiguous roundings and must reach the grader
+        ("1/6", "0.2"),
+        ("2/3", "0.7"),
+        ("22/7", "3.14"),
+        ("1/3", "0.33"),
+        ("2/3", "0.666666"),
+        ("1/6", "0.200000"),
+        # Different exact values, however close, are different answers
+        ("1000000000", "1000000001"),
+        (str(10**30), str(10**30 + 10**20)),
+        ("0.4375", "0.44"),
+        ("51.3", "51"),
+        ("24", "25"),
+        # Non-numeric answers are never matched numerically
+        ("sqrt(2) or 1.414", "1.414"),
+        ("1/0", "0"),
+    ],
+)
+def test_match_answer_defers_to_grader(ground_truth, final_answer):
+    assert _match_answer(ground_truth, final_answer) is None